@@ -5,15 +5,44 @@ import yaml
 from typing import List, Dict, Tuple
 import re
 from prompt_toolkit import PromptSession
-from prompt_toolkit.shortcuts import clear
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 import concurrent.futures
 
 from src.file_detector import FileDetector
 from src.translator import create_translator
-from src.language_detector import LanguageDetector
+from src.language_detector import LanguageDetector, cached_should_translate
+
+# Comments gathered across files are translated in chunks of this many
+TRANSLATE_CHUNK_SIZE = 200
+
+def _extract_and_filter(args: Tuple[str, str]) -> Tuple[str, Dict, Dict[int, str]]:
+    """
+    Parse one file and pick out the comments to translate
+
+    Module-level so it can run in a worker process; returns
+    (file_path, comment_map, {line: comment_content}).
+    """
+    file_path, source_language = args
+    comments = FileDetector.extract_comments(file_path)
+    # One batched detection pass over the file's comments instead of a
+    # Python-level should_translate call per comment
+    items = list(comments.items())
+    flags = LanguageDetector.should_translate_many(
+        [info['content'] for _, info in items], source_language)
+    to_translate = {
+        line: info['content']
+        for (line, info), keep in zip(items, flags) if keep
+    }
+    return file_path, comments, to_translate
+
+def _apply_translations(args: Tuple[str, Dict[int, str], Dict]) -> Tuple[str, bool]:
+    """Write translated comments back to one file (process-pool worker)"""
+    file_path, translations, comments = args
+    return file_path, FileDetector.replace_comments(file_path, translations, comments)
 
 class CodeCommentTranslator:
     def __init__(self, target_path: str, config_path: str = "config.yaml", debug: bool = False):
@@ -69,15 +98,11 @@ class CodeCommentTranslator:
 
         # If source language is specified, filter files that contain comments in that language
         if self.source_language and self.source_language.lower() not in ['any', None]:
-            filtered_files = []
-            for file_path in all_files:
-                comments = FileDetector.extract_comments(file_path)
-                if comments:
-                    # Check if any comment in the file matches the source language
-                    for info in comments.values():
-                        if LanguageDetector.should_translate(info['content'], self.source_language):
-                            filtered_files.append(file_path)
-                            break
+            # Extraction is independent per file (I/O + regex), so fan it
+            # out across the translation worker pool
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(self._file_has_source_lang, all_files)
+            filtered_files = [file_path for file_path in results if file_path]
 
             if not filtered_files:
                 self.console.print(f"[red]No files found with comments in {self.source_language} language[/red]")
@@ -93,9 +118,21 @@ class CodeCommentTranslator:
             if total_files != filtered_files:
                 self.console.print(f"[yellow]Filtered {filtered_files} files with {self.source_language} comments from {total_files} total files[/yellow]")
 
-    def display_files(self, start_index: int = 0) -> None:
+    def _file_has_source_lang(self, file_path: str) -> str:
+        """
+        Check whether a file contains any comment in the source language
+
+        Returns the file path if it does, otherwise an empty string
+        """
+        comments = FileDetector.extract_comments(file_path)
+        contents = [info['content'] for info in comments.values()]
+        if any(LanguageDetector.should_translate_many(contents, self.source_language)):
+            return file_path
+        return ''
+
+    def _build_files_view(self, start_index: int = 0) -> Group:
         """
-        Display detected files in batches
+        Build the renderable for the current page of detected files
         """
         end_index = min(start_index + self.page_size, len(self.detected_files))
 
@@ -124,49 +161,52 @@ class CodeCommentTranslator:
         if self.source_language and self.source_language.lower() not in ['any', None]:
             title += f" (Filtered for {self.source_language} comments)"
 
-        self.console.print(Panel(table, title=title))
+        parts = [Panel(table, title=title)]
 
         if end_index < len(self.detected_files):
-            self.console.print("[yellow]More files available. Press ↓ or type 'next' to see more.[/yellow]")
-
-        self.console.print("\n[bold green]Commands:[/bold green]")
-        self.console.print("- [cyan]show [id][/cyan]: Display comments in the file")
-        self.console.print("- [cyan]y[/cyan]: Translate all files")
-        self.console.print("- [cyan]next[/cyan]: Show more files")
-        self.console.print("- [cyan]back[/cyan]: Return to file list (when showing comments)")
-        self.console.print("- [cyan]quit[/cyan]: Exit program")
-
-    def show_comments(self, file_index: int, start_index: int = 0) -> None:
+            parts.append(Text.from_markup("[yellow]More files available. Press ↓ or type 'next' to see more.[/yellow]"))
+
+        parts.append(Text.from_markup(
+            "\n[bold green]Commands:[/bold green]\n"
+            "- [cyan]show \\[id][/cyan]: Display comments in the file\n"
+            "- [cyan]y[/cyan]: Translate all files\n"
+            "- [cyan]next[/cyan]: Show more files\n"
+            "- [cyan]back[/cyan]: Return to file list (when showing comments)\n"
+            "- [cyan]quit[/cyan]: Exit program"))
+        return Group(*parts)
+
+    def _build_comments_view(self, file_index: int, start_index: int = 0) -> Group:
         """
-        Show comments for a specific file without translation
+        Build the renderable showing comments of one file, without translation
         """
-        if 0 <= file_index < len(self.detected_files):
-            file_path = self.detected_files[file_index]
-            comments = FileDetector.extract_comments(file_path)
+        if not 0 <= file_index < len(self.detected_files):
+            return Group(Text.from_markup("[red]Invalid file index[/red]"))
 
-            if comments:
-                self.console.print(f"\n[bold green]Comments in {file_path}:[/bold green]")
+        file_path = self.detected_files[file_index]
+        comments = FileDetector.extract_comments(file_path)
 
-                # Get sorted line numbers
-                line_nums = sorted(comments.keys())
-                end_index = min(start_index + self.page_size, len(line_nums))
+        if not comments:
+            return Group(Text.from_markup(f"[yellow]No comments found in {file_path}[/yellow]"))
 
-                # Display comments in current batch
-                for i in range(start_index, end_index):
-                    line_num = line_nums[i]
-                    if self.debug:
-                        self.console.print(f"\n[cyan]Line {line_num}:[/cyan]")
-                        self.console.print(comments[line_num])
-                    else:
-                        self.console.print(f"[cyan]Line {line_num}:[/cyan] {comments[line_num]['content']}")
+        parts = [Text.from_markup(f"\n[bold green]Comments in {file_path}:[/bold green]")]
 
-                if end_index < len(line_nums):
-                    self.console.print("\n[yellow]More comments available. Type 'next' to see more.[/yellow]")
-                self.console.print("\n[yellow]Use 'back' to return to file list[/yellow]")
+        # Get sorted line numbers
+        line_nums = sorted(comments.keys())
+        end_index = min(start_index + self.page_size, len(line_nums))
+
+        # Display comments in current batch
+        for i in range(start_index, end_index):
+            line_num = line_nums[i]
+            if self.debug:
+                parts.append(Text.from_markup(f"\n[cyan]Line {line_num}:[/cyan]"))
+                parts.append(Text(repr(comments[line_num])))
             else:
-                self.console.print(f"[yellow]No comments found in {file_path}[/yellow]")
-        else:
-            self.console.print("[red]Invalid file index[/red]")
+                parts.append(Text.from_markup(f"[cyan]Line {line_num}:[/cyan] ") + Text(comments[line_num]['content']))
+
+        if end_index < len(line_nums):
+            parts.append(Text.from_markup("\n[yellow]More comments available. Type 'next' to see more.[/yellow]"))
+        parts.append(Text.from_markup("\n[yellow]Use 'back' to return to file list[/yellow]"))
+        return Group(*parts)
 
     def translate_file(self, file_path: str) -> bool:
         """
@@ -181,7 +221,7 @@ class CodeCommentTranslator:
             # Filter comments based on language detection
             comments_to_translate = {}
             for line, info in comments.items():
-                if LanguageDetector.should_translate(info['content'], self.source_language):
+                if cached_should_translate(info['content'], self.source_language):
                     comments_to_translate[line] = info['content']
                 elif self.debug:
                     self.console.print(f"[yellow]Skipping line {line} - not in source language {self.source_language}[/yellow]")
@@ -197,35 +237,10 @@ class CodeCommentTranslator:
             )
 
             # Process translated comments
-            processed_translations = {}
-            for line_num, translation in translated_comments.items():
-                original_comment = comments[line_num]
-
-                # Handle inline comments with multiple lines in translation
-                if original_comment['type'] == 'inline' and '\n' in translation:
-                    first_line = translation.split('\n')[0].strip()
-                    original_markers = ""
-                    original_content = original_comment['original'].strip()
-
-                    if original_content.startswith('//'):
-                        original_markers = '//'
-                    elif original_content.startswith('#'):
-                        original_markers = '#'
-                    elif original_content.startswith('/*'):
-                        original_markers = '/*'
-
-                    if original_markers:
-                        processed_translations[line_num] = f"{original_markers} {first_line}"
-                    else:
-                        processed_translations[line_num] = first_line
-
-                    if self.debug:
-                        self.console.print(f"[yellow]Warning: Multi-line translation detected for inline comment at line {line_num}. Using first line only.[/yellow]")
-                else:
-                    processed_translations[line_num] = translation
+            processed_translations = self._process_translations(comments, translated_comments)
 
-            # Replace comments in file
-            if FileDetector.replace_comments(file_path, processed_translations):
+            # Replace comments in file, reusing the comment map parsed above
+            if FileDetector.replace_comments(file_path, processed_translations, comments):
                 self.console.print(f"[green]Successfully translated comments in {file_path}[/green]")
                 return True
             return False
@@ -234,34 +249,125 @@ class CodeCommentTranslator:
             self.console.print(f"[red]Error translating {file_path}: {str(e)}[/red]")
             return False
 
+    def _process_translations(self, comments: Dict, translated_comments: Dict[int, str]) -> Dict[int, str]:
+        """
+        Normalize translated comments before write-back
+
+        Inline comments must stay on one line; multi-line translations are
+        truncated to their first line with the original marker restored.
+        """
+        processed_translations = {}
+        for line_num, translation in translated_comments.items():
+            original_comment = comments[line_num]
+
+            # Handle inline comments with multiple lines in translation
+            if original_comment['type'] == 'inline' and '\n' in translation:
+                first_line = translation.split('\n')[0].strip()
+                original_markers = ""
+                original_content = original_comment['original'].strip()
+
+                if original_content.startswith('//'):
+                    original_markers = '//'
+                elif original_content.startswith('#'):
+                    original_markers = '#'
+                elif original_content.startswith('/*'):
+                    original_markers = '/*'
+
+                if original_markers:
+                    processed_translations[line_num] = f"{original_markers} {first_line}"
+                else:
+                    processed_translations[line_num] = first_line
+
+                if self.debug:
+                    self.console.print(f"[yellow]Warning: Multi-line translation detected for inline comment at line {line_num}. Using first line only.[/yellow]")
+            else:
+                processed_translations[line_num] = translation
+
+        return processed_translations
+
     def translate_all_files(self) -> None:
         """
         Translate comments in all detected files with concurrent execution
+
+        Parsing and write-back are CPU-bound regex/string work, so they run
+        in worker processes. Comments are gathered across files and sent to
+        the translator in fixed-size chunks, so a run of many small files
+        costs a handful of round trips instead of one per file.
         """
         total_files = len(self.detected_files)
         self.console.print(f"\n[bold]Starting translation of {total_files} files with {self.max_workers} workers[/bold]")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all translation tasks
-            future_to_file = {executor.submit(self.translate_file, file_path): file_path 
-                            for file_path in self.detected_files}
-
-            # Process completed translations
-            completed = 0
-            failed = 0
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_path = future_to_file[future]
-                completed += 1
+        failed_files = set()
+        completed = 0
+
+        file_comments: Dict[str, Dict] = {}
+        file_translations: Dict[str, Dict[int, str]] = {}
+        pending: List[Tuple[str, int, str]] = []
+        chunk_futures = {}
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as cpu_pool, \
+             concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as net_pool:
+            parse_futures = [cpu_pool.submit(_extract_and_filter, (file_path, self.source_language))
+                             for file_path in self.detected_files]
+
+            # Gather comments across files, flushing a translation chunk to
+            # the network pool whenever one fills up
+            for future in concurrent.futures.as_completed(parse_futures):
+                file_path, comments, to_translate = future.result()
+                if not to_translate:
+                    self.console.print(f"[yellow]No comments in source language found in {file_path}[/yellow]")
+                    completed += 1
+                    continue
+                file_comments[file_path] = comments
+                pending.extend((file_path, line, content)
+                               for line, content in to_translate.items())
+                while len(pending) >= TRANSLATE_CHUNK_SIZE:
+                    chunk, pending = pending[:TRANSLATE_CHUNK_SIZE], pending[TRANSLATE_CHUNK_SIZE:]
+                    batch = {index: content for index, (_, _, content) in enumerate(chunk)}
+                    chunk_future = net_pool.submit(
+                        self.translator.translate_batch, batch, self.target_language)
+                    chunk_futures[chunk_future] = chunk
+            if pending:
+                batch = {index: content for index, (_, _, content) in enumerate(pending)}
+                chunk_future = net_pool.submit(
+                    self.translator.translate_batch, batch, self.target_language)
+                chunk_futures[chunk_future] = pending
+
+            # Scatter chunk results back to their files
+            for future in concurrent.futures.as_completed(chunk_futures):
+                chunk = chunk_futures[future]
                 try:
-                    if not future.result():
-                        failed += 1
+                    translated = future.result()
                 except Exception as e:
-                    self.console.print(f"[red]Error processing {file_path}: {str(e)}[/red]")
-                    failed += 1
-
+                    self.console.print(f"[red]Error translating chunk: {str(e)}[/red]")
+                    failed_files.update(file_path for file_path, _, _ in chunk)
+                    continue
+                for index, (file_path, line, content) in enumerate(chunk):
+                    file_translations.setdefault(file_path, {})[line] = translated.get(index, content)
+
+            completed += len(failed_files)
+
+            # Write the results back in worker processes
+            apply_futures = {}
+            for file_path, translations in file_translations.items():
+                if file_path in failed_files:
+                    continue
+                processed = self._process_translations(file_comments[file_path], translations)
+                apply_future = cpu_pool.submit(
+                    _apply_translations, (file_path, processed, file_comments[file_path]))
+                apply_futures[apply_future] = file_path
+
+            for future in concurrent.futures.as_completed(apply_futures):
+                file_path, ok = future.result()
+                completed += 1
+                if ok:
+                    self.console.print(f"[green]Successfully translated comments in {file_path}[/green]")
+                else:
+                    failed_files.add(file_path)
                 self.console.print(f"Progress: {completed}/{total_files} files processed")
 
-        self.console.print(f"\n[bold]Translation completed: {completed-failed} successful, {failed} failed[/bold]")
+        failed = len(failed_files)
+        self.console.print(f"\n[bold]Translation completed: {total_files-failed} successful, {failed} failed[/bold]")
 
     def interactive_mode(self) -> None:
         """
@@ -269,41 +375,51 @@ class CodeCommentTranslator:
         """
         current_start_index = 0
 
-        while True:
-            clear()
-            self.display_files(current_start_index)
-            command = self.session.prompt("\nEnter command: ").strip().lower()
-
-            if command == 'quit':
-                break
-            elif command == 'y':
-                self.translate_all_files()
-                break
-            elif command == 'next':
-                if current_start_index + self.page_size < len(self.detected_files):
-                    current_start_index += self.page_size
+        # A single Live region updated in place on each command: pagination
+        # only re-renders the changed view and the terminal does not flicker
+        with Live(self._build_files_view(current_start_index), console=self.console,
+                  auto_refresh=False) as live:
+            while True:
+                command = self.session.prompt("\nEnter command: ").strip().lower()
+
+                if command == 'quit':
+                    break
+                elif command == 'y':
+                    live.stop()
+                    self.translate_all_files()
+                    break
+                elif command == 'next':
+                    if current_start_index + self.page_size < len(self.detected_files):
+                        current_start_index += self.page_size
+                        live.update(self._build_files_view(current_start_index))
+                    else:
+                        live.update(Group(self._build_files_view(current_start_index),
+                                          Text.from_markup("[yellow]No more files to display[/yellow]")))
+                    live.refresh()
+                elif command.startswith('show '):
+                    try:
+                        file_index = int(command.split()[1])
+                        comment_start = 0
+                        live.update(self._build_comments_view(file_index, comment_start))
+                        live.refresh()
+                        while True:
+                            sub_command = self.session.prompt("\nEnter command: ").strip().lower()
+                            if sub_command == 'back':
+                                break
+                            elif sub_command == 'next':
+                                comment_start += self.page_size
+                                live.update(self._build_comments_view(file_index, comment_start))
+                                live.refresh()
+                            elif sub_command == 'quit':
+                                return
+                            else:
+                                self.console.print("[red]Invalid command. Use 'next', 'back', or 'quit'[/red]")
+                        live.update(self._build_files_view(current_start_index))
+                        live.refresh()
+                    except (ValueError, IndexError):
+                        self.console.print("[red]Invalid show command. Use 'show [id]'[/red]")
                 else:
-                    self.console.print("[yellow]No more files to display[/yellow]")
-            elif command.startswith('show '):
-                try:
-                    file_index = int(command.split()[1])
-                    comment_start = 0
-                    while True:
-                        clear()
-                        self.show_comments(file_index, comment_start)
-                        sub_command = self.session.prompt("\nEnter command: ").strip().lower()
-                        if sub_command == 'back':
-                            break
-                        elif sub_command == 'next':
-                            comment_start += self.page_size
-                        elif sub_command == 'quit':
-                            return
-                        else:
-                            self.console.print("[red]Invalid command. Use 'next', 'back', or 'quit'[/red]")
-                except (ValueError, IndexError):
-                    self.console.print("[red]Invalid show command. Use 'show [id]'[/red]")
-            else:
-                self.console.print("[red]Invalid command[/red]")
+                    self.console.print("[red]Invalid command[/red]")
 
 def main():
     parser = argparse.ArgumentParser(description='Code Comment Translator')
@@ -1,8 +1,72 @@
+import io
 import os
 import re
-from typing import List, Dict
+import tokenize
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from abc import ABC, abstractmethod
 
+# Pre-compiled patterns shared by the extractors below
+_HASH_RE = re.compile(r'#')
+_DOCSTRING_RE = re.compile(r'(\'\'\'[\s\S]*?\'\'\'|"""[\s\S]*?""")')
+_LEADING_QUOTE_RE = re.compile(r'^[ \t]*["\']')
+
+def _build_string_mask(content: str, reset_at_newline: bool = False) -> bytearray:
+    """
+    Build a mask of len(content) where mask[i] == 1 iff position i lies
+    inside a string literal, computed in a single pass
+
+    Args:
+        content: Text to scan
+        reset_at_newline: Reset quote state at line breaks, matching the
+            per-line scanning previously used for single-line comments
+    """
+    n = len(content)
+    mask = bytearray(n)
+    in_single = in_double = False
+    i = 0
+    while i < n:
+        if in_single or in_double:
+            mask[i] = 1
+        char = content[i]
+        if char == '\\':
+            if i + 1 < n:
+                if in_single or in_double:
+                    mask[i + 1] = 1
+                if reset_at_newline and content[i + 1] == '\n':
+                    in_single = in_double = False
+            i += 2  # Skip escaped character
+            continue
+        elif char == '\n':
+            if reset_at_newline:
+                in_single = in_double = False
+        elif char == '"' and not in_single:
+            in_double = not in_double
+        elif char == "'" and not in_double:
+            in_single = not in_single
+        i += 1
+    return mask
+
+def _in_intervals(starts: List[int], intervals: List[Tuple[int, int]], pos: int) -> bool:
+    """Check whether pos falls inside any of the sorted (start, end) intervals"""
+    i = bisect_right(starts, pos) - 1
+    return i >= 0 and intervals[i][1] > pos
+
+def _build_line_starts(content: str) -> List[int]:
+    """
+    Cumulative file offsets of each line start, one entry per line,
+    without materializing the line list
+    """
+    starts = [0]
+    find = content.find
+    pos = find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find('\n', pos + 1)
+    starts.append(len(content) + 1)
+    return starts
+
 class CommentExtractor(ABC):
     """Base class for language-specific comment extractors"""
 
@@ -22,12 +86,15 @@ class CommentExtractor(ABC):
         pass
 
     @abstractmethod
-    def replace_comments(self, content: str, translations: Dict[int, str]) -> str:
+    def replace_comments(self, content: str, translations: Dict[int, str],
+                         comments: Dict[int, Dict[str, str]] = None) -> str:
         """
         Replace comments in content with translations
         Args:
             content: Original file content
             translations: Dict[line_number, translated_text]
+            comments: Optional pre-parsed comment map for content, as
+                returned by extract_comments; parsed on demand if omitted
         Returns:
             Modified content with replaced comments
         """
@@ -36,76 +103,131 @@ class CStyleCommentExtractor(CommentExtractor):
     """Extracts comments from C++ files"""
 
     def extract_comments(self, content: str) -> Dict[int, Dict[str, str]]:
-        comments = {}
-
-        # Track positions of multiline comments
-        multiline_positions = set()
+        """
+        Single-pass scanner over the content
 
-        # C-style multiline comments
-        for match in re.finditer(r'/\*[\s\S]*?\*/', content):
-            start_pos = match.start()
-            end_pos = match.end()
+        One walk tracks string state, line numbers and both comment kinds at
+        once, replacing the previous multiline regex pass, single-line regex
+        pass and string-mask pass. Quotes inside comments no longer disturb
+        string tracking, and string state ends at each line break as C
+        string literals cannot span raw newlines.
+        """
+        # Fast rejection for files without any comment marker
+        if '//' not in content and '/*' not in content:
+            return {}
 
-            # Skip if this is part of a string literal
-            if self._is_in_string(content, start_pos):
+        comments = {}
+        n = len(content)
+        i = 0
+        line_num = 1
+        line_start = 0
+        in_single = in_double = False
+
+        while i < n:
+            char = content[i]
+
+            if char == '\n':
+                line_num += 1
+                line_start = i + 1
+                in_single = in_double = False
+                i += 1
                 continue
 
-            line_num = content[:start_pos].count('\n') + 1
-            original = match.group()
+            if char == '\\':
+                # A backslash-newline (macro line continuation) still ends
+                # the physical line; keep the line bookkeeping and the
+                # per-line string state in step with the newline branch
+                if i + 1 < n and content[i + 1] == '\n':
+                    line_num += 1
+                    line_start = i + 2
+                    in_single = in_double = False
+                i += 2  # Skip escaped character
+                continue
 
-            # Add all positions covered by this comment
-            for i in range(start_pos, end_pos):
-                multiline_positions.add(i)
+            if in_single or in_double:
+                if char == '"' and in_double:
+                    in_double = False
+                elif char == "'" and in_single:
+                    in_single = False
+                i += 1
+                continue
 
-            comments[line_num] = {
-                'content': self._extract_multiline_content(original),
-                'start': len(content[:start_pos].split('\n')[-1]),
-                'end': end_pos,
-                'original': original,
-                'type': 'multiline',
-                'extra': {
-                    'positions': (start_pos, end_pos),
-                    'line_count': original.count('\n') + 1
-                }
-            }
+            if char == '"':
+                in_double = True
+                i += 1
+                continue
 
-        # C-style single-line comments
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            # Skip preprocessor directives
-            if line.strip().startswith('#'):
+            if char == "'":
+                in_single = True
+                i += 1
                 continue
 
-            # Find all // comments in the line
-            for match in re.finditer(r'//', line):
-                pos = match.start()
-                pos_in_file = sum(len(l) + 1 for l in lines[:i-1]) + pos
+            if char == '/' and i + 1 < n:
+                nxt = content[i + 1]
+
+                if nxt == '*':
+                    close = content.find('*/', i + 2)
+                    if close == -1:
+                        # Unterminated block comment: not a comment, keep scanning
+                        i += 2
+                        continue
+                    start_pos = i
+                    end_pos = close + 2
+                    original = content[start_pos:end_pos]
+                    comments[line_num] = {
+                        'content': self._extract_multiline_content(original),
+                        'start': start_pos - line_start,
+                        'end': end_pos,
+                        'original': original,
+                        'type': 'multiline',
+                        'extra': {
+                            'positions': (start_pos, end_pos),
+                            'line_count': original.count('\n') + 1
+                        }
+                    }
+                    newlines = original.count('\n')
+                    if newlines:
+                        line_num += newlines
+                        line_start = start_pos + original.rfind('\n') + 1
+                    i = end_pos
+                    continue
+
+                if nxt == '/':
+                    line_end = content.find('\n', i)
+                    if line_end == -1:
+                        line_end = n
+                    line = content[line_start:line_end]
 
-                # Skip if this position is already part of a multiline comment
-                # or if it's inside a string
-                if pos_in_file in multiline_positions or self._is_in_string(line[:pos], pos):
+                    # Skip preprocessor directives
+                    if not line.strip().startswith('#'):
+                        pos = i - line_start
+                        comment_text = line[pos:]
+                        comments[line_num] = {
+                            'content': comment_text[2:].strip(),
+                            'start': pos,
+                            'end': len(line),
+                            'original': comment_text,
+                            'type': 'inline',
+                            'extra': {
+                                'has_code': bool(line[:pos].strip())
+                            }
+                        }
+                    i = line_end
                     continue
 
-                comment_text = line[pos:]
-                comments[i] = {
-                    'content': comment_text[2:].strip(),
-                    'start': pos,
-                    'end': len(line),
-                    'original': comment_text,
-                    'type': 'inline',
-                    'extra': {
-                        'has_code': bool(line[:pos].strip())
-                    }
-                }
+            i += 1
 
         return comments
 
-    def replace_comments(self, content: str, translations: Dict[int, str]) -> str:
+    def replace_comments(self, content: str, translations: Dict[int, str],
+                         comments: Dict[int, Dict[str, str]] = None) -> str:
         lines = content.split('\n')
+        if comments is None:
+            comments = self.extract_comments(content)
 
         # Process each translation
         for line_num, translation in sorted(translations.items(), reverse=True):
-            comment_info = self.extract_comments(content)[line_num]
+            comment_info = comments[line_num]
 
             if comment_info['type'] == 'inline':
                 original_line = lines[line_num - 1]
@@ -134,107 +256,72 @@ class CStyleCommentExtractor(CommentExtractor):
         return '\n'.join(lines)
 
     def _extract_multiline_content(self, comment: str) -> str:
-        # Remove /* and */ and any * at the start of lines
-        content = re.sub(r'/\*[\s\*]*|\*/\s*$', '', comment)
-        content = re.sub(r'^\s*\*\s?', '', content, flags=re.MULTILINE)
-        return content.strip()
-
-    def _is_in_string(self, content: str, pos: int) -> bool:
-        """Check if a position is inside a string literal"""
-        # Count unescaped quotes before the position
-        content = content[:pos]
-
-        # Handle string literals
-        in_single_quote = False
-        in_double_quote = False
-        i = 0
-        while i < len(content):
-            if content[i] == '\\':
-                i += 2  # Skip escaped character
-                continue
-            elif content[i] == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-            elif content[i] == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-            i += 1
+        """
+        Strip /* */ markers and per-line '*' decoration without regex
 
-        return in_single_quote or in_double_quote
+        Bare '*' separator lines collapse entirely, as the old regex pass
+        did; blank lines in undecorated comments are kept.
+        """
+        inner = comment[2:-2].lstrip(' \t\r\n*').rstrip()
+
+        # Drop a single leading '* ' decoration per line
+        cleaned = []
+        for line in inner.split('\n'):
+            stripped = line.lstrip()
+            if stripped.startswith('*'):
+                stripped = stripped[1:]
+                if stripped.startswith(' '):
+                    stripped = stripped[1:]
+                if not stripped.strip():
+                    # Decoration-only separator line
+                    continue
+                cleaned.append(stripped)
+            else:
+                cleaned.append(line)
+        return '\n'.join(cleaned).strip()
 
 class PythonCommentExtractor(CommentExtractor):
     """Extracts comments from Python files"""
 
-    def extract_comments(self, content: str) -> Dict[int, Dict[str, str]]:
-        comments = {}
-        lines = content.split('\n')
-
-        # Track positions of docstrings
-        docstring_positions = set()
-
-        # Modify the docstring pattern to better handle nested and multi-line cases
-        docstring_pattern = r'(\'\'\'[\s\S]*?\'\'\'|"""[\s\S]*?""")'
-
-        current_pos = 0
-        while True:
-            match = re.search(docstring_pattern, content[current_pos:])
-            if not match:
-                break
-
-            start_pos = current_pos + match.start()
-            end_pos = current_pos + match.end()
+    # Token types that may directly precede a docstring (start of file,
+    # start of a logical line, or after an INDENT/DEDENT)
+    _DOCSTRING_CONTEXT = {tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT}
 
-            # Ensure this position is not within other strings
-            if not self._is_in_string(content[:start_pos], start_pos):
-                # Calculate line number
-                line_num = content[:start_pos].count('\n') + 1
-                original = match.group().strip()
+    def extract_comments(self, content: str) -> Dict[int, Dict[str, str]]:
+        # Fast rejection for files without any comment marker
+        if '#' not in content and "'''" not in content and '"""' not in content:
+            return {}
 
-                # Analyze the context to determine if it is a true docstring
-                prev_lines = content[:start_pos].split('\n')
-                if prev_lines:
-                    last_line = prev_lines[-1].strip()
-                    # Check if it is a docstring after class definition, function definition, or an assignment statement
-                    if (last_line.endswith(':') or 
-                        last_line.endswith('=') or 
-                        line_num == 1 or 
-                        # Module-level docstring
-
-                        re.match(r'^[ \t]*["\']', match.group())):  # docstring at the beginning of the line
-                        # Testing
-                        comments[line_num] = {
-                            'content': original[3:-3].strip(),
-                            'start': len(prev_lines[-1]) - len(prev_lines[-1].lstrip()),
-                            'end': end_pos - current_pos,
-                            'original': original,
-                            'type': 'docstring',
-                            'extra': {
-                                'quote_type': original[:3],
-                                'line_count': original.count('\n') + 1
-                            }
-                        }
-                        # Records all positions covered by this docstring
-                        for i in range(start_pos, end_pos):
-                            docstring_positions.add(i)
+        try:
+            return self._extract_with_tokenize(content)
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            # Source the lexer rejects still gets best-effort handling
+            return self._extract_with_regex(content)
 
-            current_pos = end_pos
+    def _extract_with_tokenize(self, content: str) -> Dict[int, Dict[str, str]]:
+        """
+        Extract comments using the C-implemented tokenize module
 
-        # Python single-line comment handling remains unchanged
-        for i, line in enumerate(lines, 1):
-            if '#' in line:
-                pos = line.find('#')
-                pos_in_file = sum(len(l) + 1 for l in lines[:i-1]) + pos
+        Correctly handles f-strings, raw strings and nested quotes that the
+        regex path can misclassify, in a single linear pass.
+        """
+        comments = {}
+        line_starts = _build_line_starts(content)
+        prev_tok = None
 
-                # Skip if this position is inside a docstring or string
-                if pos_in_file in docstring_positions or self._is_in_string(line[:pos], pos):
-                    continue
+        for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+            if tok.type == tokenize.COMMENT:
+                line_num, pos = tok.start
+                line = content[line_starts[line_num - 1]:line_starts[line_num] - 1]
 
                 # Skip shebang and encoding declarations
-                if i == 1 and line.strip().startswith('#!'):
+                if line_num == 1 and line.strip().startswith('#!'):
                     continue
-                if i <= 2 and 'coding' in line:
+                if line_num <= 2 and 'coding' in line:
                     continue
 
                 comment_text = line[pos:]
-                comments[i] = {
+                comments[line_num] = {
                     'content': comment_text[1:].strip(),
                     'start': pos,
                     'end': len(line),
@@ -244,15 +331,139 @@ class PythonCommentExtractor(CommentExtractor):
                         'has_code': bool(line[:pos].strip())
                     }
                 }
+                continue
+
+            if tok.type == tokenize.STRING:
+                is_docstring_context = (
+                    prev_tok is None or
+                    prev_tok.type in self._DOCSTRING_CONTEXT or
+                    (prev_tok.type == tokenize.OP and prev_tok.string in ('=', ':')))
+
+                # Drop any r/b/f prefix so only the quoted part is kept,
+                # matching what the regex path captured
+                quote_start = 0
+                while quote_start < len(tok.string) and tok.string[quote_start] not in '"\'':
+                    quote_start += 1
+                original = tok.string[quote_start:]
+
+                if is_docstring_context and original[:3] in ('"""', "'''"):
+                    line_num = tok.start[0]
+                    token_start = line_starts[line_num - 1] + tok.start[1]
+                    line_prefix = content[line_starts[line_num - 1]:token_start]
+                    comments[line_num] = {
+                        'content': original[3:-3].strip(),
+                        'start': len(line_prefix) - len(line_prefix.lstrip()),
+                        'end': line_starts[tok.end[0] - 1] + tok.end[1],
+                        'original': original,
+                        'type': 'docstring',
+                        'extra': {
+                            'quote_type': original[:3],
+                            'line_count': original.count('\n') + 1
+                        }
+                    }
+
+            prev_tok = tok
+
+        return comments
+
+    def _extract_with_regex(self, content: str) -> Dict[int, Dict[str, str]]:
+        comments = {}
+        line_starts = _build_line_starts(content)
+
+        # Precompute string masks once so in-string checks are O(1)
+        str_mask = _build_string_mask(content)
+        line_mask = _build_string_mask(content, reset_at_newline=True)
+
+        # Track extents of docstrings as sorted intervals
+        doc_starts: List[int] = []
+        doc_intervals: List[Tuple[int, int]] = []
+
+        prev_end = 0
+        for match in _DOCSTRING_RE.finditer(content):
+            start_pos = match.start()
+            end_pos = match.end()
+
+            # Ensure this position is not within other strings
+            if not str_mask[start_pos]:
+                # Calculate line number
+                line_num = bisect_right(line_starts, start_pos)
+                original = match.group().strip()
+
+                # Analyze the context to determine if it is a true docstring
+                line_prefix = content[line_starts[line_num - 1]:start_pos]
+                last_line = line_prefix.strip()
+                # Check if it is a docstring after class definition, function definition, or an assignment statement
+                if (last_line.endswith(':') or
+                    last_line.endswith('=') or
+                    line_num == 1 or
+                    # Module-level docstring
+
+                    _LEADING_QUOTE_RE.match(match.group())):  # docstring at the beginning of the line
+                    # Testing
+                    comments[line_num] = {
+                        'content': original[3:-3].strip(),
+                        'start': len(line_prefix) - len(line_prefix.lstrip()),
+                        'end': end_pos - prev_end,
+                        'original': original,
+                        'type': 'docstring',
+                        'extra': {
+                            'quote_type': original[:3],
+                            'line_count': original.count('\n') + 1
+                        }
+                    }
+                    # Records the extent covered by this docstring
+                    doc_starts.append(start_pos)
+                    doc_intervals.append((start_pos, end_pos))
+
+            prev_end = end_pos
+
+        # Python single-line comments: one scan over the whole buffer,
+        # considering only the first '#' on each line as before
+        last_line = -1
+        for match in _HASH_RE.finditer(content):
+            pos_in_file = match.start()
+            i = bisect_right(line_starts, pos_in_file)
+            if i == last_line:
+                continue
+            last_line = i
+
+            # Skip if this position is inside a docstring or string
+            if _in_intervals(doc_starts, doc_intervals, pos_in_file) or line_mask[pos_in_file]:
+                continue
+
+            line_start = line_starts[i-1]
+            line = content[line_start:line_starts[i] - 1]
+            pos = pos_in_file - line_start
+
+            # Skip shebang and encoding declarations
+            if i == 1 and line.strip().startswith('#!'):
+                continue
+            if i <= 2 and 'coding' in line:
+                continue
+
+            comment_text = line[pos:]
+            comments[i] = {
+                'content': comment_text[1:].strip(),
+                'start': pos,
+                'end': len(line),
+                'original': comment_text,
+                'type': 'inline',
+                'extra': {
+                    'has_code': bool(line[:pos].strip())
+                }
+            }
 
         return comments
 
-    def replace_comments(self, content: str, translations: Dict[int, str]) -> str:
+    def replace_comments(self, content: str, translations: Dict[int, str],
+                         comments: Dict[int, Dict[str, str]] = None) -> str:
         lines = content.split('\n')
+        if comments is None:
+            comments = self.extract_comments(content)
 
         # Process each translation
         for line_num, translation in sorted(translations.items(), reverse=True):
-            comment_info = self.extract_comments(content)[line_num]
+            comment_info = comments[line_num]
 
             if comment_info['type'] == 'inline':
                 original_line = lines[line_num - 1]
@@ -282,28 +493,12 @@ class PythonCommentExtractor(CommentExtractor):
 
         return '\n'.join(lines)
 
-    def _is_in_string(self, content: str, pos: int) -> bool:
-        """Check if a position is inside a string literal"""
-        # Handle string literals
-        in_single_quote = False
-        in_double_quote = False
-        i = 0
-        while i < len(content):
-            if content[i] == '\\':
-                i += 2  # Skip escaped character
-                continue
-            elif content[i] == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-            elif content[i] == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-            i += 1
-
-        return in_single_quote or in_double_quote
-    
 class FileDetector:
     """Detects and processes code files"""
 
-    SUPPORTED_EXTENSIONS = {'.py', '.cpp','c','.js'}
+    SUPPORTED_EXTENSIONS = {'.py', '.cpp', '.c', '.js'}
+    # Tuple form for single C-level str.endswith checks
+    _EXT_TUPLE = tuple(sorted(SUPPORTED_EXTENSIONS))
     EXTRACTORS = {
         '.c': CStyleCommentExtractor(),
         '.cpp': CStyleCommentExtractor(),
@@ -319,19 +514,29 @@ class FileDetector:
         if os.path.isfile(target_path):
             return [target_path] if cls._is_code_file(target_path) else []
 
+        # Walk with scandir so file/dir type checks come from readdir
+        # instead of a stat call per entry
+        ext_tuple = cls._EXT_TUPLE
         code_files = []
-        for root, _, files in os.walk(target_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                if cls._is_code_file(full_path):
-                    code_files.append(full_path)
+        stack = [target_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(ext_tuple):
+                            code_files.append(entry.path)
+            except OSError:
+                continue
 
         return code_files
 
     @classmethod
     def _is_code_file(cls, file_path: str) -> bool:
         """Check if the file is a supported code file"""
-        return os.path.splitext(file_path)[1] in cls.SUPPORTED_EXTENSIONS
+        return file_path.endswith(cls._EXT_TUPLE)
 
     @classmethod
     def extract_comments(cls, file_path: str) -> Dict[int, Dict[str, str]]:
@@ -341,13 +546,39 @@ class FileDetector:
         if file_extension not in cls.EXTRACTORS:
             return {}
 
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return {}
+
+        if stat.st_size == 0:
+            return {}
+
+        # Cache key includes mtime and size so edits to the file
+        # (including our own write-back) invalidate the entry
+        return cls._extract_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_cached(file_path: str, mtime_ns: int, size: int) -> Dict[int, Dict[str, str]]:
+        """Read and parse a file once; repeated calls hit the cache"""
+        file_extension = os.path.splitext(file_path)[1]
+
+        # Read raw bytes and decode in one C-level call instead of going
+        # through the incremental text-layer decoder
+        with open(file_path, 'rb') as file:
+            content = file.read().decode('utf-8', errors='replace')
 
-        return cls.EXTRACTORS[file_extension].extract_comments(content)
+        # Text-mode reads translated CRLF; keep doing so, or '\r' leaks
+        # into comment content and offsets
+        if '\r\n' in content:
+            content = content.replace('\r\n', '\n')
+
+        return FileDetector.EXTRACTORS[file_extension].extract_comments(content)
 
     @classmethod
-    def replace_comments(cls, file_path: str, translations: Dict[int, str]) -> bool:
+    def replace_comments(cls, file_path: str, translations: Dict[int, str],
+                         comments: Dict[int, Dict[str, str]] = None) -> bool:
         """Replace comments in file with translations"""
         file_extension = os.path.splitext(file_path)[1]
 
@@ -355,14 +586,31 @@ class FileDetector:
             return False
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Strict decode on purpose: rewriting a file we cannot decode
+            # losslessly would replace every invalid byte with U+FFFD, so
+            # non-UTF-8 files fall into the failure path and stay untouched
+            with open(file_path, 'rb') as file:
+                content = file.read().decode('utf-8')
+
+            # Normalize CRLF for parsing (matching _extract_cached, whose
+            # comment map is keyed to the normalized text) and restore it
+            # on the way out so the file keeps a uniform EOL style
+            crlf = '\r\n' in content
+            if crlf:
+                content = content.replace('\r\n', '\n')
 
             extractor = cls.EXTRACTORS[file_extension]
-            new_content = extractor.replace_comments(content, translations)
+            new_content = extractor.replace_comments(content, translations, comments)
+
+            if crlf:
+                new_content = new_content.replace('\n', '\r\n')
+
+            with open(file_path, 'wb', buffering=1 << 16) as file:
+                file.write(new_content.encode('utf-8'))
 
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(new_content)
+            # Drop cached parses; mtime granularity alone is not reliable
+            # enough to guarantee the stale entry is never reused
+            cls._extract_cached.cache_clear()
 
             return True
         except Exception as e:
@@ -1,8 +1,19 @@
-import re
+try:
+    # RE2 scans character classes with a linear-time DFA and cannot hit
+    # backtracking blowups; fall back to stdlib re where it is not installed
+    import re2 as _re
+except ImportError:
+    import re as _re
+from functools import lru_cache
 from typing import Optional
 import string
 from langdetect import detect, LangDetectException
 
+# Deletion table for every character allowed in English text; built once so
+# is_english is a single C-level translate instead of a per-char Python loop
+_STRIP_ALLOWED = str.maketrans(
+    '', '', string.ascii_letters + string.digits + string.punctuation + ' \n\t\r')
+
 class LanguageDetector:
     """
     Language detector for comments using langdetect library
@@ -22,12 +33,24 @@ class LanguageDetector:
         'ja': 'jp'
     }
 
+    # Comment-marker characters trimmed from either end before detection;
+    # plain str.lstrip/rstrip over these sets beats even a compiled regex
+    _LEAD_MARKERS = '/*# \t\n\r\x0b\x0c'
+    _TRAIL_MARKERS = '*/ \t\n\r\x0b\x0c'
+
+    # Compiled once at class load; short comments pay the re-cache lookup
+    # cost on every call otherwise
+    _ZH_RE = _re.compile(PATTERNS['zh'])
+    _JP_RE = _re.compile(PATTERNS['jp'])
+    # Both CJK classes in one alternation so batch detection needs a single
+    # scan per text; the fired group names the language
+    _COMBINED_RE = _re.compile(
+        '(?P<zh>' + PATTERNS['zh'] + ')|(?P<jp>' + PATTERNS['jp'] + ')')
+
     @staticmethod
     def is_english(text: str) -> bool:
         """Check if text contains only English characters, numbers, punctuation and whitespace"""
-        text = text.strip()
-        allowed_chars = set(string.ascii_letters + string.digits + string.punctuation + ' \n\t\r')
-        return all(char in allowed_chars for char in text)
+        return not text.strip().translate(_STRIP_ALLOWED)
 
     @staticmethod
     def detect_language(text: str) -> Optional[str]:
@@ -43,26 +66,93 @@ class LanguageDetector:
         Returns:
             str: Language code ('en', 'zh', 'jp') or None if unable to detect
         """
-        # Remove common comment markers and whitespace
-        text = re.sub(r'^[\/\*\s#]+|[\*\/\s]+$', '', text).strip()
+        # Remove common comment markers, then any whitespace they exposed
+        # (the trailing strip is unicode-aware, unlike the marker sets)
+        text = text.lstrip(LanguageDetector._LEAD_MARKERS).rstrip(
+            LanguageDetector._TRAIL_MARKERS).strip()
 
         if not text:
             return None
 
-        # Check Chinese first - one drop rule
-        if re.search(LanguageDetector.PATTERNS['zh'], text):
-            return 'zh'
-
-        # Check Japanese Kana if no Chinese found
-        if re.search(LanguageDetector.PATTERNS['jp'], text):
+        # ASCII fast path: such text cannot contain CJK characters, so both
+        # range scans are skipped (isascii is an O(1) flag check)
+        if text.isascii():
+            return 'en' if LanguageDetector.is_english(text) else None
+
+        # Single traversal instead of one scan per language: any Chinese
+        # character decides immediately (one drop rule); kana only wins if
+        # the whole text held no Chinese, so it is flagged and resolved at
+        # the end. Hiragana + katakana are the contiguous block
+        # U+3040..U+30FF
+        saw_kana = False
+        for char in text:
+            if '\u4e00' <= char <= '\u9fff':
+                return 'zh'
+            if not saw_kana and '\u3040' <= char <= '\u30ff':
+                saw_kana = True
+
+        if saw_kana:
             return 'jp'
 
-        # Only if no Chinese/Japanese chars found, check if pure English
-        if LanguageDetector.is_english(text):
-            return 'en'
-
+        # Text reaching here is non-ASCII without CJK characters (accented
+        # Latin, Cyrillic, ...), which is never pure English either
         return None
 
+    @classmethod
+    def detect_languages(cls, texts) -> list:
+        """
+        Detect the language of every text in a batch
+
+        One combined compiled pattern classifies each text in a single
+        C-level scan, instead of the separate per-language scans that
+        looping detect_language would pay.
+
+        Args:
+            texts: Iterable of texts to detect
+
+        Returns:
+            list: One entry per text, 'en'/'zh'/'jp' or None
+        """
+        results = []
+        for text in texts:
+            text = text.lstrip(cls._LEAD_MARKERS).rstrip(cls._TRAIL_MARKERS).strip()
+            if not text:
+                results.append(None)
+            elif text.isascii():
+                results.append('en' if cls.is_english(text) else None)
+            else:
+                match = cls._COMBINED_RE.search(text)
+                if match is None:
+                    # Non-ASCII without CJK (accented Latin, Cyrillic, ...)
+                    # is never pure English; same verdict as detect_language
+                    results.append(None)
+                elif match.lastgroup == 'zh':
+                    results.append('zh')
+                else:
+                    # Kana matched first, but the one drop rule gives any
+                    # later Chinese character priority
+                    results.append(
+                        'zh' if cls._ZH_RE.search(text, match.end()) else 'jp')
+        return results
+
+    @classmethod
+    def should_translate_many(cls, texts, source_language: Optional[str]) -> list:
+        """
+        Batch counterpart of should_translate built on detect_languages
+
+        Args:
+            texts: Sequence of texts to check
+            source_language (str): Source language setting from config
+
+        Returns:
+            list: One bool per text
+        """
+        if not source_language or source_language.lower() == 'any':
+            return [True] * len(texts)
+
+        source = source_language.lower()
+        return [lang == source for lang in cls.detect_languages(texts)]
+
     @staticmethod
     def should_translate(text: str, source_language: Optional[str]) -> bool:
         """
@@ -81,5 +171,18 @@ class LanguageDetector:
         detected_lang = LanguageDetector.detect_language(text)
         return detected_lang == source_language.lower()
 
+@lru_cache(maxsize=4096)
+def _should_translate_cached(text: str, source_language: Optional[str]) -> bool:
+    return LanguageDetector.should_translate(text, source_language)
+
+def cached_should_translate(text: str, source_language: Optional[str]) -> bool:
+    """
+    Memoized front-end for LanguageDetector.should_translate
+
+    Comments repeat heavily across files (license headers, TODO markers),
+    and detection cost dominates; stripping before hashing raises hit rate.
+    """
+    return _should_translate_cached(text.strip(), source_language)
+
 
 #print(LanguageDetector.detect_language("のdocstring"))
\ No newline at end of file
@@ -1,26 +1,32 @@
+from functools import lru_cache
 from typing import Optional
 import yaml
 from .base import BaseTranslator
 from .openai_translator import OpenAITranslator
 
+@lru_cache(maxsize=None)
+def _load_config(config_path: str) -> dict:
+    """Load and parse a config file once; repeat calls reuse the parsed dict"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        raise Exception(f"Failed to load config file: {e}")
+
 def create_translator(config_path: str = "config.yaml") -> BaseTranslator:
     """
     Factory function to create appropriate translator instance
-    
+
     Args:
         config_path (str): Path to configuration file
-        
+
     Returns:
         BaseTranslator: Configured translator instance
     """
-    try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-    except Exception as e:
-        raise Exception(f"Failed to load config file: {e}")
+    config = _load_config(config_path)
 
     # Currently only OpenAI is supported
     # Future implementations can be added here based on config
-    return OpenAITranslator(config_path)
+    return OpenAITranslator(config_path, config=config)
 
 __all__ = ['BaseTranslator', 'OpenAITranslator', 'create_translator']
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 from tqdm import tqdm
 
@@ -6,16 +7,20 @@ class BaseTranslator(ABC):
     """
     Abstract base class for translation services
     """
-    
+
+    # Number of requests kept in flight by translate_batch; subclasses may
+    # override (e.g. from config). Kept modest to respect API rate limits.
+    max_workers = 8
+
     @abstractmethod
     def translate_single(self, text: str, target_language: str) -> str:
         """
         Translate a single piece of text
-        
+
         Args:
             text (str): Text to be translated
             target_language (str): Target language code
-        
+
         Returns:
             str: Translated text
         """
@@ -23,22 +28,29 @@ class BaseTranslator(ABC):
 
     def translate_batch(self, comments: Dict[int, str], target_language: str) -> Dict[int, str]:
         """
-        Translate a batch of comments with progress bar
-        
+        Translate a batch of comments concurrently with progress bar
+
+        The work is pure network I/O, so overlapping requests with a thread
+        pool collapses N round trips into roughly N / max_workers.
+
         Args:
             comments (Dict[int, str]): Dictionary of line numbers and comments
             target_language (str): Target language code
-            
+
         Returns:
             Dict[int, str]: Dictionary of line numbers and translated comments
         """
         translated_comments = {}
-        
+
         # Create progress bar
         with tqdm(total=len(comments), desc="Translating comments") as pbar:
-            for line_num, comment in comments.items():
-                translated = self.translate_single(comment, target_language)
-                translated_comments[line_num] = translated
-                pbar.update(1)
-        
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self.translate_single, comment, target_language): line_num
+                    for line_num, comment in comments.items()
+                }
+                for future in as_completed(futures):
+                    translated_comments[futures[future]] = future.result()
+                    pbar.update(1)
+
         return translated_comments
@@ -1,42 +1,200 @@
+import re
 import yaml
-from openai import OpenAI
+try:
+    import orjson as _json  # ~3x stdlib json on decode
+except ImportError:
+    import json as _json
+try:
+    import httpx
+except ImportError:
+    httpx = None
+import asyncio
+import threading
+from typing import Dict, List
+from openai import AsyncOpenAI, OpenAI
+from tqdm import tqdm
 from .base import BaseTranslator
 from .prompt_template import PromptTemplate
+from ..language_detector import LanguageDetector
+
+try:
+    import msgspec
+
+    # Minimal completion schema: msgspec decodes and validates it in one C
+    # pass, cheaper than both a full-dict decode and the SDK's Pydantic
+    # models; only the fields read below are declared
+    class _Message(msgspec.Struct):
+        content: str
+
+    class _Choice(msgspec.Struct):
+        message: _Message
+
+    class _ChatCompletion(msgspec.Struct):
+        choices: List[_Choice]
+
+    _COMPLETION_DECODER = msgspec.json.Decoder(_ChatCompletion)
+except ImportError:
+    _COMPLETION_DECODER = None
+
+
+def _decode_content(body) -> str:
+    """Extract choices[0].message.content from a raw completion body"""
+    if _COMPLETION_DECODER is not None:
+        return _COMPLETION_DECODER.decode(body).choices[0].message.content
+    return _json.loads(body)['choices'][0]['message']['content']
+
 
 class OpenAITranslator(BaseTranslator):
     """
     Translator implementation using OpenAI's API
     """
-    
-    def __init__(self, config_path: str = "config.yaml"):
+
+    # Matches one '[n] translation' entry in a numbered response; the
+    # lookahead lets a translation span lines until the next marker
+    _NUMBERED_RE = re.compile(r'\[(\d+)\]\s*(.*?)(?=\n\[\d+\]|\Z)', re.S)
+
+
+    def __init__(self, config_path: str = "config.yaml", config: dict = None):
         """
         Initialize OpenAI Translator
-        
+
         Args:
             config_path (str): Path to configuration file
+            config (dict): Already-parsed configuration; when given, the
+                file at config_path is not read again
         """
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-        except Exception as e:
-            raise Exception(f"Failed to load config file: {e}")
+        if config is None:
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    config = yaml.safe_load(f)
+            except Exception as e:
+                raise Exception(f"Failed to load config file: {e}")
 
         openai_config = config.get('openai', {})
         self.api_key = openai_config.get('api_key')
         self.base_url = openai_config.get('base_url')
         self.model_name = openai_config.get('model_name', 'gpt-4o-mini')
+        self.max_workers = openai_config.get('max_workers', BaseTranslator.max_workers)
+        self.batch_size = openai_config.get('batch_size', 20)
 
         if not self.api_key:
             raise ValueError("OpenAI API key not found in config file")
 
+        # Duplicate comments (license headers, '# TODO', boilerplate
+        # docstrings) are common; remember finished translations so each
+        # distinct text hits the API once per target language
+        self._cache: dict = {}
+
+        # System prompt text per target language, resolved once at first use
+        self._system_prompts: dict = {}
+
         try:
             self.client = OpenAI(
                 api_key=self.api_key,
-                base_url=self.base_url
+                base_url=self.base_url,
+                http_client=self._build_http_client()
+            )
+            self.async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self._build_http_client(is_async=True)
             )
         except ImportError:
             raise ImportError("OpenAI library is not installed. Please install it using 'pip install openai'")
-    
+
+        # One event loop shared by every translate_batch call, started
+        # lazily on its own daemon thread so the async client keeps a
+        # single warm connection pool across batches
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    @staticmethod
+    def _build_http_client(is_async: bool = False):
+        """
+        Build an httpx client with a pool sized for batch translation
+
+        Generous keep-alive limits let concurrent workers reuse warm TLS
+        connections instead of paying a handshake per burst; HTTP/2
+        multiplexing is enabled when the optional h2 extra is installed.
+
+        Args:
+            is_async (bool): Build an AsyncClient instead of a Client
+
+        Returns:
+            An httpx.Client/AsyncClient, or None to keep the SDK default
+        """
+        if httpx is None:
+            return None
+        client_cls = httpx.AsyncClient if is_async else httpx.Client
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        try:
+            return client_cls(http2=True, timeout=30.0, limits=limits)
+        except ImportError:
+            # h2 is not installed; plain HTTP/1.1 keep-alive still avoids
+            # the per-request connection churn
+            return client_cls(timeout=30.0, limits=limits)
+
+    def _ensure_loop(self):
+        """
+        Return the shared event loop, starting its thread on first use
+
+        translate_batch may be called from several worker threads at once;
+        funnelling every coroutine onto one loop keeps a single async
+        client and connection pool instead of a loop per caller.
+        """
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="translator-loop",
+                        daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+
+    def _system_prompt(self, target_language: str) -> str:
+        """
+        Return the cached system prompt for a target language
+
+        Keeping the text identical across calls costs nothing locally and
+        lets providers with prefix caching skip re-prefilling it.
+
+        Args:
+            target_language (str): Target language code
+
+        Returns:
+            str: System prompt text
+        """
+        prompt = self._system_prompts.get(target_language)
+        if prompt is None:
+            prompt = self._system_prompts.setdefault(
+                target_language,
+                PromptTemplate.get_openai_prompt(target_language)['system'])
+        return prompt
+
+    def _complete_raw(self, messages) -> str:
+        """
+        Blocking completion through the raw-response path
+
+        The body is decoded straight from bytes and the content pulled out
+        of the dict, skipping the SDK's Pydantic model construction — a
+        small but fully avoidable cost per response.
+
+        Args:
+            messages: Chat messages for the completion
+
+        Returns:
+            str: The completion content
+        """
+        raw = self.client.with_raw_response.chat.completions.create(
+            model=self.model_name,
+            messages=messages
+        )
+        return _decode_content(raw.content)
+
     def translate_single(self, text: str, target_language: str) -> str:
         """
         Translate text using OpenAI's API
@@ -51,24 +209,225 @@ class OpenAITranslator(BaseTranslator):
         try:
             # Clean comment markers before translation
             clean_text = PromptTemplate.clean_comment_markers(text)
-            
-            # Get translation prompt
-            prompt = PromptTemplate.get_openai_prompt(target_language)
-            
+
+            # Reuse a previous translation of the same text if available;
+            # only the comment markers differ between occurrences
+            # Already in the target language: nothing to do, no tokens spent
+            if LanguageDetector.detect_language(clean_text) == target_language.lower():
+                return text
+
+            cache_key = (clean_text, target_language)
+            if cache_key in self._cache:
+                return PromptTemplate.restore_comment_format(text, self._cache[cache_key])
+
             # Make API call
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": prompt["system"]},
-                    {"role": "user", "content": "Instruction:Please only output the translated results, do not output any other content \n Code comments that need to be translated:"+clean_text}
-                ]
-            )
-            
-            translated_text = response.choices[0].message.content.strip()
+            messages = [
+                {"role": "system", "content": self._system_prompt(target_language)},
+                {"role": "user", "content": "Instruction:Please only output the translated results, do not output any other content \n Code comments that need to be translated:"+clean_text}
+            ]
+            try:
+                # Stream the completion so tokens are consumed as they
+                # arrive instead of blocking until the final one
+                response = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    stream=True
+                )
+                translated_text = ''.join(
+                    chunk.choices[0].delta.content or ''
+                    for chunk in response if chunk.choices
+                ).strip()
+            except Exception:
+                # Some providers do not support SSE; retry blocking
+                translated_text = self._complete_raw(messages).strip()
             #print(translated_text)
+            self._cache[cache_key] = translated_text
             # Restore comment format
             return PromptTemplate.restore_comment_format(text, translated_text)
             
         except Exception as e:
             print(f"Translation error: {e}")
             return text  # Return original text if translation fails
+
+    def translate_many(self, comments: Dict[int, str], target_language: str) -> Dict[int, str]:
+        """
+        Translate several comments with a single API call
+
+        Comments are packed into one numbered prompt and parsed back out of
+        the numbered response, so the system prompt and network round trip
+        are paid once per group instead of once per comment.
+
+        Args:
+            comments (Dict[int, str]): Dictionary of line numbers and comments
+            target_language (str): Target language code
+
+        Returns:
+            Dict[int, str]: Dictionary of line numbers and translated comments
+        """
+        translated_comments, clean_texts, pending = self._prefilter(comments, target_language)
+
+        if pending:
+            try:
+                content = self._complete_raw(
+                    self._numbered_messages(pending, clean_texts, target_language))
+                self._scatter_numbered(
+                    content, comments, pending, clean_texts, target_language,
+                    translated_comments)
+            except Exception as e:
+                print(f"Translation error: {e}")
+
+        # Retry anything the model skipped (or a failed request) one by one
+        for line_num in comments:
+            if line_num not in translated_comments:
+                translated_comments[line_num] = self.translate_single(
+                    comments[line_num], target_language)
+
+        return translated_comments
+
+    def _prefilter(self, comments: Dict[int, str], target_language: str):
+        """
+        Resolve cached and already-target-language comments up front
+
+        Returns:
+            Tuple of (translated so far, clean text per line,
+            prompt index -> line number for what still needs the API)
+        """
+        translated_comments = {}
+        clean_texts = {}
+        pending = {}
+
+        for line_num, comment in comments.items():
+            clean_text = PromptTemplate.clean_comment_markers(comment)
+            clean_texts[line_num] = clean_text
+            cache_key = (clean_text, target_language)
+            if LanguageDetector.detect_language(clean_text) == target_language.lower():
+                translated_comments[line_num] = comment
+            elif cache_key in self._cache:
+                translated_comments[line_num] = PromptTemplate.restore_comment_format(
+                    comment, self._cache[cache_key])
+            else:
+                pending[len(pending)] = line_num
+
+        return translated_comments, clean_texts, pending
+
+    def _numbered_messages(self, pending, clean_texts, target_language: str):
+        """Build the chat messages for one numbered multi-comment prompt"""
+        numbered = "\n".join(
+            f"[{index}] {clean_texts[line_num]}"
+            for index, line_num in pending.items()
+        )
+        return [
+            {"role": "system", "content": self._system_prompt(target_language)},
+            {"role": "user", "content": (
+                "Instruction:Translate each numbered comment and reply with "
+                "the same [number] markers, one per comment. Please only "
+                "output the translated results, do not output any other "
+                "content \n Code comments that need to be translated:\n" + numbered)}
+        ]
+
+    def _scatter_numbered(self, content, comments, pending, clean_texts,
+                          target_language, translated_comments):
+        """Parse a numbered response back onto line numbers, filling the cache"""
+        for match in self._NUMBERED_RE.finditer(content):
+            index = int(match.group(1))
+            if index not in pending:
+                continue
+            line_num = pending[index]
+            translated_text = match.group(2).strip()
+            self._cache[(clean_texts[line_num], target_language)] = translated_text
+            translated_comments[line_num] = PromptTemplate.restore_comment_format(
+                comments[line_num], translated_text)
+
+    async def _complete_raw_async(self, messages) -> str:
+        """Async twin of _complete_raw on the shared AsyncOpenAI client"""
+        raw = await self.async_client.with_raw_response.chat.completions.create(
+            model=self.model_name,
+            messages=messages
+        )
+        return _decode_content(raw.content)
+
+    async def translate_many_async(self, comments: Dict[int, str], target_language: str) -> Dict[int, str]:
+        """
+        Async counterpart of translate_many
+
+        Args:
+            comments (Dict[int, str]): Dictionary of line numbers and comments
+            target_language (str): Target language code
+
+        Returns:
+            Dict[int, str]: Dictionary of line numbers and translated comments
+        """
+        translated_comments, clean_texts, pending = self._prefilter(comments, target_language)
+
+        if pending:
+            try:
+                content = await self._complete_raw_async(
+                    self._numbered_messages(pending, clean_texts, target_language))
+                self._scatter_numbered(
+                    content, comments, pending, clean_texts, target_language,
+                    translated_comments)
+            except Exception as e:
+                print(f"Translation error: {e}")
+
+        # Retry skipped entries one by one; translate_single blocks, so it
+        # runs on an executor thread to keep the loop free
+        loop = asyncio.get_running_loop()
+        for line_num in comments:
+            if line_num not in translated_comments:
+                translated_comments[line_num] = await loop.run_in_executor(
+                    None, self.translate_single, comments[line_num], target_language)
+
+        return translated_comments
+
+    async def translate_batch_async(self, comments: Dict[int, str], target_language: str) -> Dict[int, str]:
+        """
+        Translate a batch of comments as concurrent numbered-prompt groups
+
+        A semaphore keeps at most max_workers groups in flight; within that
+        limit the event loop multiplexes every request over the shared
+        connection pool without per-request thread handoffs.
+
+        Args:
+            comments (Dict[int, str]): Dictionary of line numbers and comments
+            target_language (str): Target language code
+
+        Returns:
+            Dict[int, str]: Dictionary of line numbers and translated comments
+        """
+        translated_comments = {}
+        items = list(comments.items())
+        chunks = [dict(items[i:i + self.batch_size])
+                  for i in range(0, len(items), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_chunk(chunk):
+            async with semaphore:
+                return await self.translate_many_async(chunk, target_language)
+
+        with tqdm(total=len(comments), desc="Translating comments") as pbar:
+            for task in asyncio.as_completed([run_chunk(chunk) for chunk in chunks]):
+                result = await task
+                translated_comments.update(result)
+                pbar.update(len(result))
+
+        return translated_comments
+
+    def translate_batch(self, comments: Dict[int, str], target_language: str) -> Dict[int, str]:
+        """
+        Translate a batch of comments with progress bar
+
+        Runs translate_batch_async on the shared background loop, so sync
+        callers (including ones on different threads) transparently share
+        one async client.
+
+        Args:
+            comments (Dict[int, str]): Dictionary of line numbers and comments
+            target_language (str): Target language code
+
+        Returns:
+            Dict[int, str]: Dictionary of line numbers and translated comments
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.translate_batch_async(comments, target_language),
+            self._ensure_loop())
+        return future.result()
@@ -1,3 +1,20 @@
+import re
+from functools import lru_cache
+
+# All comment markers in one alternation; a single sub pass replaces six
+# chained str.replace scans (each of which copies the whole string)
+_COMMENT_MARKER_RE = re.compile(r'#|//|"""|\'\'\'|/\*|\*/')
+
+# Comment style -> output template, keyed by the marker that opens the
+# comment; probing the 3/2/1-char prefixes against this table replaces the
+# ordered startswith chain (longest marker wins automatically)
+_FORMATTERS = {
+    '"""': '"""\n{}\n"""',
+    "'''": "'''\n{}\n'''",
+    '//': '// {}',
+    '/*': '/*\n{}\n*/',
+    '#': '# {}',
+}
 
 
 class PromptTemplate:
@@ -6,10 +23,14 @@ class PromptTemplate:
     """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_openai_prompt(target_language: str) -> dict:
         """
         Get OpenAI translation prompt
-        
+
+        Built once per target language; byte-identical prompts across calls
+        also let providers with prefix caching dedupe the repeated prefill.
+
         Args:
             target_language (str): Target language for translation
             
@@ -36,17 +57,8 @@ class PromptTemplate:
         Returns:
             str: Clean text without comment markers
         """
-        # Remove single-line comment markers
-        text = text.replace('#', '').replace('//', '')
-        
-        # Remove multi-line comment markers
-        text = text.replace('"""', '').replace("'''", '')
-        text = text.replace('/*', '').replace('*/', '')
-        
-        # Clean up any remaining whitespace
-        text = text.strip()
-        
-        return text
+        # Strip every marker kind in one scan, then trim whitespace
+        return _COMMENT_MARKER_RE.sub('', text).strip()
 
     @staticmethod
     def restore_comment_format(original: str, translated: str) -> str:
@@ -60,15 +72,11 @@ class PromptTemplate:
         Returns:
             str: Translated text with restored comment markers
         """
-        # Detect original comment style
-        if original.startswith('#'):
-            return f"# {translated}"
-        elif original.startswith('//'):
-            return f"// {translated}"
-        elif original.startswith('"""') or original.startswith("'''"):
-            marker = '"""' if original.startswith('"""') else "'''"
-            return f"{marker}\n{translated}\n{marker}"
-        elif original.startswith('/*'):
-            return f"/*\n{translated}\n*/"
-        
+        # Detect original comment style by its opening marker
+        template = (_FORMATTERS.get(original[:3])
+                    or _FORMATTERS.get(original[:2])
+                    or _FORMATTERS.get(original[:1]))
+        if template:
+            return template.format(translated)
+
         return translated  # Default case